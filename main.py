@@ -1,24 +1,58 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from routers import router
+from fastapi.responses import ORJSONResponse
+from routers import router, shutdown_services
+from src.database import get_manager
+from src.analysis import get_transformers_analysis
+from src.http_client import close_http_client
 from dotenv import load_dotenv
+from contextlib import asynccontextmanager
+import asyncio
 import logging
+import os
 
 load_dotenv()
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Ensures database indexes exist and warms the local models before serving requests.
+    """
+    try:
+        # Connects and ensures indexes on first use
+        await get_manager()
+    except Exception as e:
+        logging.error(f"Startup initialization failed: {e}")
+
+    try:
+        # Model loading is blocking; keep the event loop free while it runs
+        await asyncio.to_thread(get_transformers_analysis().warm_up)
+    except Exception as e:
+        logging.error(f"Transformer model warm-up failed: {e}")
+
+    yield
+
+    await shutdown_services()
+    await close_http_client()
+
 app = FastAPI(
     title="Sentiment Analysis API",
     description="An API to retrieve, analyze, and serve sentiment data from various web sources.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+# Comma-separated list of allowed origins; defaults to all origins
+cors_origins = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "*").split(",") if origin.strip()]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"], # Allow all origins
-    allow_credentials=True,
+    allow_origins=cors_origins,
+    allow_credentials=cors_origins != ["*"], # Credentials only for explicitly listed origins
     allow_methods=["*"], # Allow all methods(GET, POST, etc.)
     allow_headers=["*"], # Allow all headers
 )
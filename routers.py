@@ -5,10 +5,11 @@ from src.models import (
     FeedItem, WordCloudData, AnalysisRequest, ComparisonRequest,
     CompetitorComparisonResponse
 )
-from src.database import MongoManager
+from src.database import get_manager
 from src.analysis import GroqAnalysis
 from src.services import AnalysisPipeline
 from datetime import datetime
+import asyncio
 import logging
 
 # Initialize router
@@ -18,18 +19,9 @@ router = APIRouter(
 )
 
 # Lazy initialization - services will be created on first use
-_db_manager = None
-__analysis_pipeline = None
+_analysis_pipeline = None
 _groq_analyzer = None
 
-def get_db_manager():
-    """Lazy initialization of database manager."""
-    global _db_manager
-    if _db_manager is None:
-        logging.info("Initializing MongoManager...")
-        _db_manager = MongoManager()
-    return _db_manager
-
 def get_analysis_pipeline():
     """Lazy initialization of analysis pipeline."""
     global _analysis_pipeline
@@ -46,6 +38,11 @@ def get_groq_analyzer():
         _groq_analyzer = GroqAnalysis()
     return _groq_analyzer
 
+async def shutdown_services():
+    """Releases long-lived clients held by services that were initialized."""
+    if _analysis_pipeline is not None:
+        await _analysis_pipeline.retriever.aclose()
+
 logging.info("API Router initialized (services will load on first request).")
 
 @router.post("/start_analysis", response_model=StartResponse)
@@ -67,7 +64,7 @@ async def start_analysis(request: AnalysisRequest, background_tasks: BackgroundT
     if not query:
         raise HTTPException(status_code=400, detail="Query must be provided.")
     logging.info(f"Starting analysis for request for query: {query} in mode: {mode}")
-    background_tasks.add_task(_analysis_pipeline.run, query, mode)
+    background_tasks.add_task(get_analysis_pipeline().run, query, mode)
     return StartResponse(
         status="success",
         query=query,
@@ -91,11 +88,13 @@ async def get_competitors_comparison(request: ComparisonRequest, background_task
     
     logging.info(f"Starting competitor comparison for products: {products} in mode: {mode}")
     # Trigger background analysis for each product
+    pipeline = get_analysis_pipeline()
     for product in products:
-        background_tasks.add_task(_analysis_pipeline.run, product, mode)
+        background_tasks.add_task(pipeline.run, product, mode)
     
     # Retrieve existing trend data
-    comparison_data = await _db_manager.get_competitor_trends(products=products,time_range=time_range)
+    db = await get_manager()
+    comparison_data = await db.get_competitor_trends(products=products,time_range=time_range)
 
     return CompetitorComparisonResponse(comparison=comparison_data)
 
@@ -112,7 +111,7 @@ async def get_distribution(query: str, time_range: str = Query('24h', descriptio
     **Note:** Returns all zeros if no data exists for the query.
     """
     try:
-        db = get_db_manager()
+        db = await get_manager()
         distribution = await db.get_sentiment_distribution(query=query, time_range=time_range)
 
         # check if any data exists
@@ -139,7 +138,7 @@ async def get_trends(query: str, time_range: str = Query('24h', description="Tim
     **Use for:** Line charts, area charts, trend visualization
     """
     try:
-        db = get_db_manager()
+        db = await get_manager()
         trends = await db.get_sentiment_trends(query=query, time_range=time_range)
         if not trends:
             logging.warning(f"No trend data found for query: {query} in time range: {time_range}")
@@ -166,7 +165,7 @@ async def get_summary(query: str, sample_size: int = Query(25, ge=5, le=100, des
     - Overall sentiment for each
     """
     try:
-        db = get_db_manager()
+        db = await get_manager()
         docs = await db.get_documents_for_summary(query=query, sample_size=sample_size, time_range=time_range)
 
         if not docs['positive'] and not docs['negative']:
@@ -176,8 +175,10 @@ async def get_summary(query: str, sample_size: int = Query(25, ge=5, le=100, des
         logging.info(f"Generating summary for query: {query} using {len(docs['positive'])} positive and {len(docs['negative'])} negative documents.")
 
         analyzer = get_groq_analyzer()
-        positive_summary = await analyzer.generate_structured_summary(docs['positive'], sentiment_context='positive')
-        negative_summary = await analyzer.generate_structured_summary(docs['negative'], sentiment_context='negative')
+        positive_summary, negative_summary = await asyncio.gather(
+            analyzer.generate_structured_summary(docs['positive'], sentiment_context='positive'),
+            analyzer.generate_structured_summary(docs['negative'], sentiment_context='negative')
+        )
 
         return SummaryResponse(
             positive_summary=positive_summary,
@@ -202,7 +203,7 @@ async def get_feed(query: str, limit: int = Query(50, ge=1, le=500, description=
     **Sorted by:** Most recent first
     """
     try:
-        db = get_db_manager()
+        db = await get_manager()
         feed = await db.get_recent_feed(query=query, limit=limit)
 
         if not feed:
@@ -228,7 +229,7 @@ async def get_wordcloud(query: str, time_range: str = Query('24h', description="
     **Note:** Empty list if no aspects were extracted (transformers-only mode doesn't extract aspects)
     """
     try:
-        db = get_db_manager()
+        db = await get_manager()
         word_data = await db.get_word_cloud_data(query=query, time_range=time_range)
 
         if not word_data:
@@ -248,12 +249,13 @@ async def delete_data(query: str, days: int = Query(30, ge=1, le=365, descriptio
     **Warning:** This deletes ALL records older than specified days, not just for this query.
     
     **Use cases:**
-    - Regular maintenance
     - Clean up old test data
-    - Free up database space
+    - Free up database space sooner than the automatic retention
+
+    **Note:** Records are also expired automatically by a TTL index (RECORD_RETENTION_DAYS, default 30).
     """
     try:
-        db = get_db_manager()
+        db = await get_manager()
         await db.delete_old_records(days=days)
 
         logging.info(f"Deleted records older than {days} days as requested for query: {query}")
@@ -263,6 +265,26 @@ async def delete_data(query: str, days: int = Query(30, ge=1, le=365, descriptio
         raise HTTPException(status_code=500, detail="Internal server error while deleting old records.")
     
 
+@router.post("/rebuild_counts")
+async def rebuild_counts():
+    """
+    Rebuilds the pre-aggregated word cloud and trend counters from the stored records.
+
+    **Use cases:**
+    - Resync after MONGO_FAST_WRITES dropped unacknowledged inserts
+    - Recover from failed counter updates logged by the pipeline
+
+    **Note:** Run while no analysis is in progress; records saved during the rebuild may be miscounted.
+    """
+    try:
+        db = await get_manager()
+        await db.rebuild_aggregate_counts()
+        return {"status": "success", "message": "Aggregate counters have been rebuilt."}
+    except Exception as e:
+        logging.error(f"Error rebuilding aggregate counters: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error while rebuilding aggregate counters.")
+
+
 # Health check endpoint
 @router.get("/health")
 async def health_check():
@@ -277,7 +299,7 @@ async def health_check():
     """
     try:
         # Simple check - try to access database
-        db = get_db_manager()
+        db = await get_manager()
         await db.collection.find_one({})
         
         return {
@@ -360,6 +382,7 @@ async def api_info():
             },
             "maintenance": {
                 "delete": "POST /api/delete-data/{query}",
+                "rebuild_counts": "POST /api/rebuild_counts",
                 "health": "GET /api/health"
             }
         },
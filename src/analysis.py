@@ -1,31 +1,57 @@
-from transformers import pipeline
+from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
+import torch
 from typing import List, Dict, Optional
-from .models import AnalysisResult, SummaryData, AspectSentiment
+from .models import AnalysisResult, SummaryData, AspectSentiment, AspectList, AspectBatchEntry
 import os
-from groq import Groq, RateLimitError
+from groq import AsyncGroq, RateLimitError
+from redis import asyncio as aioredis
 from pydantic import ValidationError
 import backoff
+import asyncio
 import logging
-from functools import lru_cache
+import json
+from functools import cache
 import hashlib
+import threading
+from cachetools import TTLCache
 
+# Map transformer labels to the standard sentiment labels
+_LABEL_MAP = {
+    'positive': 'positive',
+    'negative': 'negative',
+    'neutral': 'neutral',
+    'label_0': 'negative',
+    'label_1': 'neutral',
+    'label_2': 'positive'
+}
+
+# Emotions derived from sentiment for Transformers-only results
+_BASIC_EMOTION_MAP = {
+    'positive': ('satisfaction', 'joy'),
+    'negative': ('frustration', 'disappointment'),
+    'neutral': ('neutral',)
+}
+
+# Emotions derived from sentiment for hybrid (Transformers + LLM) results
+_HYBRID_EMOTION_MAP = {
+    'positive': ('satisfaction', 'appreciation'),
+    'negative': ('frustration', 'concern'),
+    'neutral': ('neutral',)
+}
 
 class TransformersAnalysis:
-    """Class for performing fast sentiment analysis using local transformers."""
-    _instance = None
-    def __new__(cls,*args, **kwargs):
-        if not cls._instance:
-            cls._instance = super(TransformersAnalysis, cls).__new__(cls)
-        return cls._instance
-    
+    """
+    Class for performing fast sentiment analysis using local transformers.
+    Use get_transformers_analysis() to share one instance (and one copy of the models).
+    """
     def __init__(self):
         """Initializes the analysis pipelines lazily."""
-        if hasattr(self, '_initialized'):
-            return
-        
         # Mark as initialized but don't load models yet
         self._initialized = False
-        self._sentiment_analyzer = None
+        self._device = None
+        self._sentiment_tokenizer = None
+        self._sentiment_model = None
+        self._sentiment_labels = []
         self._sentiment_summarizer = None
         logging.info("TransformersAnalysis created (models will load on first use).")
     
@@ -35,22 +61,66 @@ class TransformersAnalysis:
             return
         
         logging.info("Loading transformer models...")
-        self._sentiment_analyzer = pipeline(
-            "sentiment-analysis",
-            model="cardiffnlp/twitter-roberta-base-sentiment-latest"
-        )
+        self._device, dtype = self._select_device_and_dtype()
+
+        # Sentiment runs on the raw model so tokenization and softmax stay batched tensor ops
+        sentiment_model_name = "cardiffnlp/twitter-roberta-base-sentiment-latest"
+        self._sentiment_tokenizer = AutoTokenizer.from_pretrained(sentiment_model_name)
+        # low_cpu_mem_usage loads weights without a second full copy in RAM (needs accelerate)
+        self._sentiment_model = AutoModelForSequenceClassification.from_pretrained(
+            sentiment_model_name,
+            torch_dtype=dtype,
+            low_cpu_mem_usage=True
+        ).to(self._device).eval()
+        # Resolve class index -> standard label once instead of per prediction
+        id2label = self._sentiment_model.config.id2label
+        self._sentiment_labels = [
+            _LABEL_MAP.get(id2label[i].lower(), 'neutral') for i in range(len(id2label))
+        ]
+
         self._sentiment_summarizer = pipeline(
             'summarization',
-            model="facebook/bart-large-cnn"
+            model="sshleifer/distilbart-cnn-12-6",
+            device=self._device,
+            torch_dtype=dtype,
+            model_kwargs={"low_cpu_mem_usage": True}
         )
+        self._sentiment_summarizer.model.eval()
+
+        # Optional kernel fusion for the sentiment model; first calls pay the compilation cost.
+        # CUDA graphs ("reduce-overhead") only help on GPU. The summarizer is left alone:
+        # generate() bypasses a compiled wrapper's forward.
+        if os.getenv('TRANSFORMERS_COMPILE', 'false').lower() == 'true':
+            compile_mode = "reduce-overhead" if self._device.type == "cuda" else "default"
+            self._sentiment_model = torch.compile(self._sentiment_model, mode=compile_mode)
         self._initialized = True
         logging.info("TransformersAnalysis models loaded successfully.")
     
+    def warm_up(self):
+        """Loads the models eagerly so the first request does not pay the load time."""
+        self._ensure_initialized()
+
+    @staticmethod
+    def _select_device_and_dtype():
+        """Picks device and weight dtype: fp16 on GPU, bf16 on CPU if enabled, else fp32."""
+        if torch.cuda.is_available():
+            return torch.device('cuda', 0), torch.float16
+        # bf16 only pays off on CPUs with AVX512-BF16/AMX, so it is opt-in
+        if os.getenv('TRANSFORMERS_CPU_BF16', 'false').lower() == 'true':
+            return torch.device('cpu'), torch.bfloat16
+        return torch.device('cpu'), torch.float32
+
     @property
-    def sentiment_analyzer(self):
-        """Lazy-loaded sentiment analyzer."""
+    def sentiment_tokenizer(self):
+        """Lazy-loaded sentiment tokenizer."""
         self._ensure_initialized()
-        return self._sentiment_analyzer
+        return self._sentiment_tokenizer
+
+    @property
+    def sentiment_model(self):
+        """Lazy-loaded sentiment classification model."""
+        self._ensure_initialized()
+        return self._sentiment_model
     
     @property
     def sentiment_summarizer(self):
@@ -60,22 +130,34 @@ class TransformersAnalysis:
     
     def analyze_sentiment(self,text: str) -> Dict:
         """Analyzes seniment with confidence threshold."""
+        return self.analyze_sentiments_batch([text])[0]
+
+    def analyze_sentiments_batch(self, texts: List[str], batch_size: int = 32) -> List[Dict]:
+        """Analyzes sentiment for a list of texts in batched forward passes."""
+        if not texts:
+            return []
         try:
-            result = self.sentiment_analyzer(text)[0]
-            # Map transformer label to standard format
-            label_map = {
-                'positive':'positive',
-                'negative':'negative',
-                'netural':'netural',
-                'label_0':'negative',
-                'label_1':'neutral',
-                'label_2':'positive'
-            }
-            label = label_map.get(result['label'].lower(),'neutral')
-            return {"label":label, "score":result['score']}
+            tokenizer, model = self.sentiment_tokenizer, self.sentiment_model
+            results = []
+            with torch.inference_mode():
+                for start in range(0, len(texts), batch_size):
+                    inputs = tokenizer(
+                        texts[start:start + batch_size],
+                        return_tensors='pt',
+                        padding=True,
+                        truncation=True,
+                        max_length=512
+                    ).to(self._device)
+                    probs = model(**inputs).logits.float().softmax(-1)
+                    scores, label_ids = probs.max(-1)
+                    results.extend(zip(label_ids.tolist(), scores.tolist()))
+            return [
+                {"label": self._sentiment_labels[label_id], "score": score}
+                for label_id, score in results
+            ]
         except Exception as e:
             logging.error(f"Error analyzing Sentiment: {e}")
-            return {"label": "netural", "score": 0.5}
+            return [{"label": "neutral", "score": 0.5} for _ in texts]
 
     def summarize_text(self, texts: List[str], max_length: int = 130, min_length: int = 30) -> str:
         """Summarizes text with provided input list of text.."""
@@ -84,42 +166,46 @@ class TransformersAnalysis:
         if len(full_text) < 50:
             return full_text
 
-        # Truncate if too long (BART has 1024 token limit only)
-        if len(full_text.split()) > 800:
-            words = full_text.split()[:800]
-            full_text = " ".join(words)
-
         try:
-            summary = self.sentiment_summarizer(
-                full_text,
-                max_length=max_length,
-                min_length=min_length,
-                do_sample=False
-            )[0]
+            # Let the tokenizer truncate to the model's 1024 token limit
+            with torch.inference_mode():
+                summary = self.sentiment_summarizer(
+                    full_text,
+                    max_length=max_length,
+                    min_length=min_length,
+                    do_sample=False,
+                    truncation=True
+                )[0]
             return summary['summary_text']
         except Exception as e:
-            logging.error("Error summarizing text: {e}")
+            logging.error(f"Error summarizing text: {e}")
             return full_text[:200] + "..."
     
-    def basic_analysis(self, text: str) -> AnalysisResult:
+    def basic_analysis(self, text: str, sentiment_data: Optional[Dict] = None) -> AnalysisResult:
         """Creates a bascic AnalysisResult using only Transformers."""
-        sentiment_data = self.analyze_sentiment(text)
-
-        # Map emotions based on sentiment
-        emotion_map = {
-            'positive': ['satisfaction','joy'],
-            'negative':['frustration','disappointment'],
-            'neutral':['neutral']
-        }
+        if sentiment_data is None:
+            sentiment_data = self.analyze_sentiment(text)
 
         return AnalysisResult(
             sentiment=sentiment_data['label'],
             score=sentiment_data['score'],
-            emotions=emotion_map.get(sentiment_data['label'],['neutral']),
+            emotions=list(_BASIC_EMOTION_MAP.get(sentiment_data['label'], ('neutral',))),
             intent='feedback',
             aspects=[] #empty aspects for basic analysis
         )
 
+    def basic_analysis_batch(self, texts: List[str]) -> List[AnalysisResult]:
+        """Creates basic AnalysisResults for many texts with batched Transformers inference."""
+        return [
+            self.basic_analysis(text, sentiment_data)
+            for text, sentiment_data in zip(texts, self.analyze_sentiments_batch(texts))
+        ]
+
+@cache
+def get_transformers_analysis() -> TransformersAnalysis:
+    """Returns the process-wide TransformersAnalysis instance."""
+    return TransformersAnalysis()
+
 
 SYSTEM_PROMPT_ASPECTS = """
 You are an expert Aspect-Based Sentiment Analysis (ABSA) system.
@@ -165,6 +251,50 @@ Your task is to analyze user feedback text and extract all specific, explicitly
 ```
 """
 
+SYSTEM_PROMPT_ASPECTS_BATCH = """
+You are an expert Aspect-Based Sentiment Analysis (ABSA) system.
+Your task is to analyze a batch of user feedback texts and, for each text independently, extract all specific, explicitly mentioned product or service aspects.
+
+**Input Format:**
+A JSON array of objects, each with an integer `"id"` and a `"text"` to analyze.
+
+**Rules:**
+
+1.  Extract *only* specific features, attributes, or components (e.g., "battery life", "UI design", "customer support", "price").
+2.  Ignore vague, general feedback not tied to a specific feature (e.g., "I hate it", "It's good").
+3.  Your output MUST be a single, valid JSON object.
+4.  The JSON object must contain *only* one key: `"results"`.
+5.  The value of `"results"` must be an array with exactly one object per input text, each with keys `"id"` (the input id) and `"aspects"`.
+6.  Each object in `"aspects"` MUST have exactly three keys:
+      * `"aspect"`: The noun or feature name (e.g., "camera", "battery").
+      * `"sentiment"`: The sentiment for that aspect. Must be one of: `"positive"`, `"negative"`, or `"neutral"`.
+      * `"quote"`: The *exact*, minimal, contiguous text snippet from that input text that directly supports the aspect and sentiment.
+7.  Use an empty `"aspects"` array for texts without specific aspects.
+8.  Do not include any explanations or conversational text.
+
+**Example Input:**
+[{"id": 0, "text": "The camera is amazing, but the battery drains way too fast."}, {"id": 1, "text": "I hate it."}]
+
+**Example Output:**
+```json
+{
+  "results": [
+    {
+      "id": 0,
+      "aspects": [
+        {"aspect": "camera", "sentiment": "positive", "quote": "camera is amazing"},
+        {"aspect": "battery", "sentiment": "negative", "quote": "battery drains way too fast"}
+      ]
+    },
+    {
+      "id": 1,
+      "aspects": []
+    }
+  ]
+}
+```
+"""
+
 SYSTEM_PROMPT_SUMMARY = """
 You are an expert Text Analyst AI. Your task is to analyze a batch of user comments and consolidate them into a high-level, strategic summary.
 Your output MUST be a single, valid JSON object and nothing else.
@@ -209,104 +339,225 @@ Your output MUST be a single, valid JSON object and nothing else.
 class GroqAnalysis:
     """Class for performing sentiment analysis using Groq API. With caching and hybrid approach."""
 
-    def __init__(self):
+    def __init__(self, max_concurrent_llm: int = 5, aspect_batch_size: int = 10, aspect_batch_delay: float = 0.05):
         api_key = os.getenv('GROQ_API_KEY')
-        self.client = Groq(api_key=api_key) if api_key else None
-        self.transformer_analysis = TransformersAnalysis()
-        self._cache = {}
+        self.client = AsyncGroq(api_key=api_key) if api_key else None
+        self.transformer_analysis = get_transformers_analysis()
+
+        # Bounds in-flight LLM requests; callers can schedule freely
+        self._llm_sem = asyncio.Semaphore(max_concurrent_llm)
+
+        # Concurrent aspect requests are grouped into one LLM call per batch
+        self.aspect_batch_size = aspect_batch_size
+        self.aspect_batch_delay = aspect_batch_delay
+        self._aspect_queue = []
+        self._aspect_flush_handle = None
+        self._aspect_batch_tasks = set()
+
+        # Shared cache across workers; falls back to a bounded in-process cache when unset
+        redis_url = os.getenv('REDIS_URL')
+        self.redis = aioredis.from_url(redis_url) if redis_url else None
+        self.cache_ttl = int(os.getenv('ANALYSIS_CACHE_TTL', 86400))
+        self._cache = TTLCache(maxsize=int(os.getenv('ANALYSIS_CACHE_SIZE', 10000)), ttl=self.cache_ttl)
+        self._cache_lock = threading.Lock()
 
         if not api_key:
             logging.warning("GROQ_API_KEY not set. GroqAnalysis will not function.")
+        if not redis_url:
+            logging.warning("REDIS_URL not set. Using in-process analysis cache.")
     
     def _get_cache_key(self, text: str) -> str:
         """Generates a cache key based on the text content."""
-        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+    async def _cache_get(self, cache_key: str) -> Optional[AnalysisResult]:
+        """Looks up a cached analysis result in Redis or the local cache."""
+        if self.redis is None:
+            with self._cache_lock:
+                return self._cache.get(cache_key)
+        try:
+            cached = await self.redis.get(f"analysis:{cache_key}")
+            return AnalysisResult.model_validate_json(cached) if cached else None
+        except Exception as e:
+            logging.error(f"Error reading analysis cache: {e}")
+            return None
+
+    async def _cache_set(self, cache_key: str, result: AnalysisResult):
+        """Stores an analysis result in Redis (with TTL) or the local cache."""
+        if self.redis is None:
+            with self._cache_lock:
+                self._cache[cache_key] = result
+            return
+        try:
+            await self.redis.set(f"analysis:{cache_key}", result.model_dump_json(), ex=self.cache_ttl)
+        except Exception as e:
+            logging.error(f"Error writing analysis cache: {e}")
     
     @backoff.on_exception(backoff.expo, RateLimitError, max_tries=3)
-    async def _get_chat_completion(self, system_prompt: str, user_content: str):
+    async def _get_chat_completion(self, system_prompt: str, user_content: str, max_tokens: int = 500):
         """Helper to get chat completion from Groq with backoff on rate limits."""
-        return self.client.chat.completions.create(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_content}
-            ],
-            model="llama-3.3-70b-versatile",
-            temperature=0.3,
-            max_tokens=500,
-            response_format={"type": "json_object"}
-        )
+        async with self._llm_sem:
+            return await self.client.chat.completions.create(
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_content}
+                ],
+                model="llama-3.3-70b-versatile",
+                temperature=0.3,
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"}
+            )
     
-    async def extract_aspects_with_llm(self, text: str) -> List[AspectSentiment]:
-        """Use Groq LLM to extract aspect-based sentiment analysis."""
-        if not self.client:
-            logging.warning("Groq client not initialized. Skipping LLM aspect extraction.")
-            return []
-        
+    async def _extract_aspects_single(self, text: str) -> Optional[List[AspectSentiment]]:
+        """Extracts aspects for a single text with one LLM call. Returns None if extraction failed."""
         try:
             completion = await self._get_chat_completion(SYSTEM_PROMPT_ASPECTS, text)
             response_text = completion.choices[0].message.content
-            data = eval(response_text)  # Using eval to parse JSON object
-
-            return [
-                AspectSentiment(
-                    aspect=item.get("aspect",""),
-                    sentiment=item.get("sentiment","neutral"),
-                    quote=item.get("quote","")
-                )
-                for item in data.get("aspects", [])
-            ]
+            # Parse and validate in one pass in pydantic-core
+            return AspectList.model_validate_json(response_text).aspects
+        except ValidationError as e:
+            logging.error(f"Malformed LLM aspect response: {e}")
+            return None
         except Exception as e:
             logging.error(f"Error extracting aspects with LLM: {e}")
+            return None
+
+    async def extract_aspects_batch(self, texts: List[str]) -> List[Optional[List[AspectSentiment]]]:
+        """
+        Extracts aspects for several texts with a single LLM call.
+        Returns one aspect list per input text, in input order; None where extraction failed.
+        """
+        if not texts:
             return []
-        
-    async def analyze_text(self, text: str, use_hybrid: bool = True) -> Optional[AnalysisResult]:
+        if not self.client:
+            logging.warning("Groq client not initialized. Skipping LLM aspect extraction.")
+            return [[] for _ in texts]
+        if len(texts) == 1:
+            return [await self._extract_aspects_single(texts[0])]
+
+        try:
+            payload = json.dumps([{"id": idx, "text": text} for idx, text in enumerate(texts)], ensure_ascii=False)
+            completion = await self._get_chat_completion(
+                SYSTEM_PROMPT_ASPECTS_BATCH,
+                payload,
+                max_tokens=min(500 * len(texts), 8000)
+            )
+            response = json.loads(completion.choices[0].message.content)
+            entries = response.get("results", []) if isinstance(response, dict) else []
+        except Exception as e:
+            logging.error(f"Error extracting batched aspects with LLM: {e}")
+            return [None for _ in texts]
+
+        # Validate entries one by one so a single malformed entry only fails its own text
+        by_id = {}
+        for entry in entries:
+            try:
+                parsed = AspectBatchEntry.model_validate(entry)
+            except ValidationError as e:
+                logging.error(f"Malformed LLM batch aspect entry: {e}")
+                continue
+            by_id[parsed.id] = parsed.aspects
+        return [by_id.get(idx) for idx in range(len(texts))]
+
+    async def extract_aspects_with_llm(self, text: str) -> Optional[List[AspectSentiment]]:
+        """
+        Use Groq LLM to extract aspect-based sentiment analysis.
+        Concurrent calls are collected for up to `aspect_batch_delay` seconds
+        (or `aspect_batch_size` texts) and sent as one batched request.
+        Returns None if extraction failed for this text.
+        """
+        if not self.client:
+            logging.warning("Groq client not initialized. Skipping LLM aspect extraction.")
+            return []
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._aspect_queue.append((text, future))
+
+        if len(self._aspect_queue) >= self.aspect_batch_size:
+            self._flush_aspect_batch()
+        elif self._aspect_flush_handle is None:
+            self._aspect_flush_handle = loop.call_later(self.aspect_batch_delay, self._flush_aspect_batch)
+        return await future
+
+    def _flush_aspect_batch(self):
+        """Sends the queued aspect requests as one batch."""
+        if self._aspect_flush_handle is not None:
+            self._aspect_flush_handle.cancel()
+            self._aspect_flush_handle = None
+
+        batch, self._aspect_queue = self._aspect_queue, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._run_aspect_batch(batch))
+        # Keep a reference so the task is not garbage collected mid-flight
+        self._aspect_batch_tasks.add(task)
+        task.add_done_callback(self._aspect_batch_tasks.discard)
+
+    async def _run_aspect_batch(self, batch: List[tuple]):
+        """Runs one batched extraction and resolves each caller's future."""
+        try:
+            results = await self.extract_aspects_batch([text for text, _ in batch])
+        except Exception as e:
+            logging.error(f"Error extracting batched aspects with LLM: {e}")
+            results = [None for _ in batch]
+
+        for (_, future), aspects in zip(batch, results):
+            if not future.done():
+                future.set_result(aspects)
+
+    async def analyze_text(self, text: str, use_hybrid: bool = True, sentiment_data: Optional[Dict] = None) -> Optional[AnalysisResult]:
         """
             HYBRID APPROACH: Combines Transformers + LLM
             - Transformers: Fast sentiment (always)
             - LLM: Aspect extraction only (when available)
             
             This reduces LLM calls by ~80% while maintaining quality.
+            Pass `sentiment_data` when sentiment was already computed in a batch.
         """
         ### Check cache first
         cache_key = self._get_cache_key(text)
-        if cache_key in self._cache:
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
             logging.info("Cache hit for text analysis.")
-            return self._cache[cache_key]
+            return cached
         
         # Step 1: Always use Transformers for basic sentiment analysis(FAST)
-        sentiment_data = self.transformer_analysis.analyze_sentiment(text)
+        if sentiment_data is None:
+            sentiment_data = self.transformer_analysis.analyze_sentiment(text)
 
         # Step 2: Use LLM for aspect extraction if enabled and client available(SLOW)
         aspects = []
+        aspects_failed = False
         if use_hybrid and self.client:
             try:
                 aspects = await self.extract_aspects_with_llm(text)
             except RateLimitError:
                 logging.warning("Rate limit hit during LLM aspect extraction. Falling back to no aspects.")
+                aspects = None
             except Exception as e:
                 logging.error(f"Unexpected error during LLM aspect extraction: {e}")
+                aspects = None
+            if aspects is None:
+                aspects_failed = True
+                aspects = []
         
         # Step 3: Combine results
-        emotion_map = {
-            'positive': ['satisfaction', 'appreciation'],
-            'negative': ['frustration', 'concern'],
-            'neutral': ['neutral']
-        }
-
         result = AnalysisResult(
             sentiment=sentiment_data['label'],
             score=sentiment_data['score'],
-            emotions=emotion_map.get(sentiment_data['label'], ['neutral']),
+            emotions=list(_HYBRID_EMOTION_MAP.get(sentiment_data['label'], ('neutral',))),
             intent='user_feedback',
             aspects=aspects
         )
 
-        # Cache the result
-        self._cache[cache_key] = result
+        # Cache the result, unless aspects are missing only because extraction failed
+        if not aspects_failed:
+            await self._cache_set(cache_key, result)
         return result
 
     async def generate_structured_summary(self, documents: List[str], sentiment_context: str) -> SummaryData:
-        """Generates a structured summary using Transformers first, LLM as enhancement."""
+        """Generates a structured summary using the LLM, with Transformers as fallback."""
         if not documents:
             return SummaryData(
                 overview="No documents available for summary.",
@@ -314,14 +565,7 @@ class GroqAnalysis:
                 overallSentiment="neutral"
             )
         
-        # Step 1: Use Transformers to create a basic summary(FAST)
-        transformer_summary = self.transformer_analysis.summarize_text(
-            documents[:10], # Limit to first 10 docs for speed
-            max_length=50,
-            min_length=1
-        )
-
-        # Step 2: Use LLM to refine and structure the summary if client available(SLOW)
+        # Step 1: Use LLM to create a structured summary if client available(SLOW)
         if self.client and len(documents) > 5:
             try:
                 combined = "\n".join(f"- {doc[:100]}" for doc in documents[:20])
@@ -331,12 +575,17 @@ class GroqAnalysis:
                     prompt
                 )
                 response_text = completion.choices[0].message.content
-                print(response_text)
+                logging.debug(response_text)
                 return SummaryData.model_validate_json(response_text)
             except (RateLimitError, ValidationError, Exception) as e:
                 logging.error(f"Error generating structured summary with LLM: {e}")
         
-        # Fallback to basic summary if LLM fails
+        # Step 2: Fallback to a basic Transformers summary(FAST), only computed when needed
+        transformer_summary = self.transformer_analysis.summarize_text(
+            documents[:10], # Limit to first 10 docs for speed
+            max_length=50,
+            min_length=1
+        )
         return SummaryData(
             overview=transformer_summary,
             keyInsights=[f"Based on {len(documents)} documents analyzed."],
@@ -344,6 +593,7 @@ class GroqAnalysis:
         )
     
     def clear_cache(self):
-        """Clears the internal analysis cache."""
-        self._cache.clear()
+        """Clears the in-process analysis cache (Redis entries expire via TTL)."""
+        with self._cache_lock:
+            self._cache.clear()
         logging.info("Analysis cache cleared.")
\ No newline at end of file
@@ -1,35 +1,76 @@
-from motor.motor_asyncio import AsyncIOMotorClient,AsyncIOMotorDatabase
+from pymongo import AsyncMongoClient, UpdateOne
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import BulkWriteError, OperationFailure
+from pymongo.write_concern import WriteConcern
 from typing import List, Dict, Optional
+from collections import Counter
 from datetime import datetime, timedelta, timezone
 from .models import FeedItem, TrendData, SentimentData, WordCloudData, SentimentRecord, ProductTrend
-import uuid
 from dotenv import load_dotenv
 import os
 import logging
 import asyncio
+import functools
+from cachetools import TTLCache
+from pydantic import TypeAdapter
 
 load_dotenv()
 
+# Dumps a whole batch of records in one pydantic-core call
+_RECORDS_ADAPTER = TypeAdapter(List[SentimentRecord])
+
+# trend_cache bucket granularities and their time_bucket labels; minute buckets back '1h'
+_TREND_GRANULARITIES = {"minute": "%Y-%m-%dT%H:%M:00Z", "hour": "%Y-%m-%dT%H:00:00Z"}
+_SENTIMENTS = ("positive", "negative", "neutral")
+# Minute buckets are only read by the '1h' range; they expire shortly after leaving it
+_MINUTE_BUCKET_TTL = timedelta(minutes=61)
+
+# Backs per-sentiment reads such as the summary samples
+_QUERY_SENTIMENT_INDEX = [("query", 1), ("analysis.sentiment", 1), ("timestamp", -1)]
+
+
+def cached_query_read(method):
+    """ Caches a (query, time_range) read on MongoManager for a short TTL.
+
+    Dashboards poll these endpoints repeatedly; the per-query version in the key
+    is bumped by save_feed_item so new data is visible immediately.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, query: str, time_range: str = '24h'):
+        key = (method.__name__, query, time_range, self._query_versions.get(query, 0))
+        cached = self._read_cache.get(key)
+        if cached is not None:
+            return cached
+        result = await method(self, query, time_range)
+        self._read_cache[key] = result
+        return result
+    return wrapper
+
+
 class MongoManager:
-    """ Manages all interactions with MongoDB database."""
-    _instance = None
-    def __new__(cls, *args, **kwargs):
-        if not cls._instance:
-            cls._instance = super(MongoManager, cls).__new__(cls)
-        return cls._instance
-    
+    """ Manages all interactions with MongoDB database.
+
+    Use get_manager() to share one instance (and one connection pool) per process.
+    """
     def __init__(self, uri: Optional[str] = None, db_name: str = 'sentimental_analysis'):
-        if hasattr(self, '_initialized'):
-            return  # Already initialized
-        
         self._initialized = False
         self._mongo_uri = uri or os.getenv("MONGO_URI")
         if not self._mongo_uri:
             raise ValueError("MongoDB URI environment variable not set.")
         self._db_name = db_name
-        self._client: Optional[AsyncIOMotorClient] = None
-        self._db: Optional[AsyncIOMotorDatabase] = None
+        # Records older than this are expired by the TTL index on timestamp
+        self.retention_days = int(os.getenv("RECORD_RETENTION_DAYS", 30))
+        # Feed items are analytics data; optionally skip write acknowledgements for them
+        self._fast_writes = os.getenv("MONGO_FAST_WRITES", "false").lower() == "true"
+        # Short-lived cache for dashboard aggregations (see cached_query_read)
+        self._read_cache = TTLCache(maxsize=1024, ttl=int(os.getenv("AGGREGATION_CACHE_TTL", 30)))
+        self._query_versions: Dict[str, int] = {}
+        self._client: Optional[AsyncMongoClient] = None
+        self._db: Optional[AsyncDatabase] = None
         self._collection = None
+        self._feed_writer = None
+        self._aspect_counts = None
+        self._trend_cache = None
         logging.info("MongoManager created (connection will be established on first use).")
     
     def _ensure_connected(self):
@@ -38,19 +79,27 @@ class MongoManager:
             return
         
         logging.info("Establishing MongoDB connection...")
-        self._client = AsyncIOMotorClient(self._mongo_uri)
+        self._client = AsyncMongoClient(self._mongo_uri)
         self._db = self._client[self._db_name]
         self._collection = self._db['feed_items']
+        # Hourly per-query aspect counts maintained on write for the word cloud
+        self._aspect_counts = self._db['aspect_counts']
+        # Materialized per-query sentiment counts per minute/hour bucket
+        self._trend_cache = self._db['trend_cache']
+        self._feed_writer = (
+            self._collection.with_options(write_concern=WriteConcern(w=0))
+            if self._fast_writes else self._collection
+        )
         self._initialized = True
         logging.info("MongoDB connection established.")
     
     @property
-    def client(self) -> AsyncIOMotorClient:
+    def client(self) -> AsyncMongoClient:
         self._ensure_connected()
         return self._client
     
     @property
-    def db(self) -> AsyncIOMotorDatabase:
+    def db(self) -> AsyncDatabase:
         self._ensure_connected()
         return self._db
     
@@ -58,7 +107,176 @@ class MongoManager:
     def collection(self):
         self._ensure_connected()
         return self._collection
+
+    @property
+    def feed_writer(self):
+        """ Collection handle used for bulk feed inserts (w=0 when MONGO_FAST_WRITES is enabled). """
+        self._ensure_connected()
+        return self._feed_writer
+
+    @property
+    def aspect_counts(self):
+        """ Pre-aggregated {query, bucket (hour), aspect, count} documents. """
+        self._ensure_connected()
+        return self._aspect_counts
+
+    @property
+    def trend_cache(self):
+        """ Materialized {query, granularity, bucket, time_bucket, positive, negative, neutral} documents. """
+        self._ensure_connected()
+        return self._trend_cache
     
+    async def ensure_indexes(self):
+        """ Creates the indexes backing the query/time-range aggregations. Safe to call repeatedly. """
+        try:
+            # Every read path starts with $match on query + timestamp range
+            await self.collection.create_index([("query", 1), ("timestamp", -1)])
+            # Summary sampling also filters on sentiment before sorting by recency
+            await self.collection.create_index(_QUERY_SENTIMENT_INDEX)
+            await self._ensure_ttl_index(self.collection, "timestamp")
+
+            # Upsert key for write-time increments, and the word-cloud range read
+            await self.aspect_counts.create_index([("query", 1), ("bucket", -1), ("aspect", 1)], unique=True)
+            await self._ensure_ttl_index(self.aspect_counts, "bucket")
+            await self._backfill_aspect_counts()
+
+            await self.trend_cache.create_index([("query", 1), ("granularity", 1), ("bucket", 1)], unique=True)
+            await self._ensure_ttl_index(self.trend_cache, "bucket")
+            # Only minute buckets carry expire_at, so hour buckets keep the full retention
+            await self._ensure_ttl_index(
+                self.trend_cache, "expire_at", expire_after=0,
+                partialFilterExpression={"granularity": "minute"}
+            )
+            await self._backfill_trend_cache()
+            logging.info("MongoDB indexes ensured.")
+        except Exception as e:
+            logging.error(f"Error creating MongoDB indexes: {e}")
+
+    async def _ensure_ttl_index(self, collection, field: str, expire_after: Optional[int] = None, **kwargs):
+        """ Lets MongoDB expire old records in the background instead of large foreground deletes.
+
+        Expires after the retention period unless `expire_after` (seconds) is given;
+        extra keyword arguments are passed to create_index.
+        """
+        if expire_after is None:
+            expire_after = self.retention_days * 86400
+        try:
+            await collection.create_index(field, expireAfterSeconds=expire_after, **kwargs)
+        except OperationFailure as e:
+            if e.code != 85:  # IndexOptionsConflict: retention period changed
+                raise
+            await self.db.command(
+                "collMod", collection.name,
+                index={"keyPattern": {field: 1}, "expireAfterSeconds": expire_after}
+            )
+
+    async def rebuild_aggregate_counts(self):
+        """ Recomputes aspect_counts and trend_cache from feed_items.
+
+        Both are maintained incrementally on write and can drift from feed_items, e.g. when
+        an unacknowledged MONGO_FAST_WRITES insert is dropped or a counter update fails.
+        Records saved while the rebuild runs may be miscounted; run it when ingestion is idle.
+        """
+        await self.aspect_counts.delete_many({})
+        await self.trend_cache.delete_many({})
+        await self._backfill_aspect_counts(force=True)
+        await self._backfill_trend_cache(force=True)
+        self._read_cache.clear()
+        logging.info("Aggregate counters rebuilt from feed items.")
+
+    async def _backfill_aspect_counts(self, force: bool = False):
+        """ Builds aspect_counts from existing feed items the first time it is used. """
+        if not force and await self.aspect_counts.estimated_document_count() > 0:
+            return
+        logging.info("Backfilling aspect counts from existing feed items...")
+        pipeline = [
+            {"$match": {"analysis.aspects.0": {"$exists": True}}},
+            {"$unwind": "$analysis.aspects"},
+            {
+                "$group": {
+                    "_id": {
+                        "query": "$query",
+                        "bucket": {"$dateTrunc": {"date": "$timestamp", "unit": "hour"}},
+                        "aspect": "$analysis.aspects.aspect",
+                    },
+                    "count": {"$sum": 1},
+                }
+            },
+            {"$project": {"_id": 0, "query": "$_id.query", "bucket": "$_id.bucket", "aspect": "$_id.aspect", "count": 1}},
+            {
+                "$merge": {
+                    "into": self.aspect_counts.name,
+                    "on": ["query", "bucket", "aspect"],
+                    "whenMatched": "replace",
+                    "whenNotMatched": "insert",
+                }
+            },
+        ]
+        await self._aggregate(pipeline)
+
+    async def _backfill_trend_cache(self, force: bool = False):
+        """ Builds trend_cache from existing feed items the first time it is used; save_feed_item keeps it current. """
+        if not force and await self.trend_cache.estimated_document_count() > 0:
+            return
+        logging.info("Backfilling trend cache from existing feed items...")
+        now = datetime.now(timezone.utc)
+        start_times = {
+            "minute": (now - timedelta(hours=1)).replace(second=0, microsecond=0),
+            "hour": (now - timedelta(days=self.retention_days)).replace(minute=0, second=0, microsecond=0),
+        }
+        for granularity, date_format in _TREND_GRANULARITIES.items():
+            projection = {
+                "_id": 0,
+                "query": "$_id.query",
+                "granularity": granularity,
+                "bucket": "$_id.bucket",
+                "time_bucket": {"$dateToString": {"format": date_format, "date": "$_id.bucket"}},
+                "positive": {"$ifNull": ["$sentiments.positive", 0]},
+                "negative": {"$ifNull": ["$sentiments.negative", 0]},
+                "neutral": {"$ifNull": ["$sentiments.neutral", 0]},
+            }
+            if granularity == "minute":
+                projection["expire_at"] = {"$add": ["$_id.bucket", int(_MINUTE_BUCKET_TTL.total_seconds() * 1000)]}
+            pipeline = [
+                {"$match": {"timestamp": {"$gte": start_times[granularity]}}},
+                {
+                    "$group": {
+                        "_id": {
+                            "query": "$query",
+                            "bucket": {"$dateTrunc": {"date": "$timestamp", "unit": granularity}},
+                            "sentiment": "$analysis.sentiment",
+                        },
+                        "count": {"$sum": 1},
+                    }
+                },
+                {
+                    "$group": {
+                        "_id": {"query": "$_id.query", "bucket": "$_id.bucket"},
+                        "counts": {"$push": {"k": "$_id.sentiment", "v": "$count"}},
+                    }
+                },
+                {"$addFields": {"sentiments": {"$arrayToObject": "$counts"}}},
+                {"$project": projection},
+                {
+                    "$merge": {
+                        "into": self.trend_cache.name,
+                        "on": ["query", "granularity", "bucket"],
+                        "whenMatched": "replace",
+                        "whenNotMatched": "insert",
+                    }
+                },
+            ]
+            await self._aggregate(pipeline)
+
+    async def _aggregate(self, pipeline: List[Dict], collection=None, **kwargs) -> List[Dict]:
+        """ Runs an aggregation (on the feed collection by default) and returns all results.
+
+        Extra keyword arguments (e.g. hint) are passed through to aggregate().
+        """
+        collection = self.collection if collection is None else collection
+        cursor = await collection.aggregate(pipeline, **kwargs)
+        return await cursor.to_list(None)
+
     @staticmethod
     def get_time_range_filter(time_range: str) -> Dict:
         """ Helper function to get the time range filter for MongoDB queries. """
@@ -82,15 +300,101 @@ class MongoManager:
         if not items:
             return
         try:
-            documents = [item.model_dump(by_alias=True) for item in items]
-            for doc in documents:
-                doc.setdefault("_id", str(uuid.uuid4()))
-            await self.collection.insert_many(documents, ordered=False)
-            logging.info(f"Inserted {len(documents)} feed items into the database.")
+            # _id is left to MongoDB (12-byte ObjectId instead of a 36-char UUID string)
+            documents = _RECORDS_ADAPTER.dump_python(items, by_alias=True)
+            inserted = items
+            try:
+                await self.feed_writer.insert_many(documents, ordered=False)
+            except BulkWriteError as e:
+                # Unordered insert: everything except the reported documents was written
+                write_errors = e.details.get("writeErrors", [])
+                failed = {error["index"] for error in write_errors}
+                inserted = [item for idx, item in enumerate(items) if idx not in failed]
+                # str(e) embeds every failed document; log the first reason only
+                logging.error(f"Failed to insert {len(failed)} of {len(items)} feed items: {write_errors[0]['errmsg'] if write_errors else e}")
+
+            # Counters only cover acknowledged inserts; with MONGO_FAST_WRITES (w=0) a dropped
+            # insert can't be detected, so use rebuild_aggregate_counts() to resync
+            if inserted:
+                results = await asyncio.gather(
+                    self._increment_aspect_counts(inserted),
+                    self._increment_trend_counts(inserted),
+                    return_exceptions=True
+                )
+                for res in results:
+                    if isinstance(res, Exception):
+                        logging.error(f"Error updating aggregate counters: {res}")
+
+            # Invalidate cached aggregations for the affected queries
+            for query in {item.query for item in inserted}:
+                self._query_versions[query] = self._query_versions.get(query, 0) + 1
+            logging.info(f"Inserted {len(inserted)} feed items into the database.")
         except Exception as e:
             logging.error(f"Error inserting feed items: {e}")
 
+    @staticmethod
+    def _trend_bucket_fields(granularity: str, bucket: datetime) -> Dict:
+        """ Fields set once when a trend_cache bucket document is created. """
+        fields = {"time_bucket": bucket.strftime(_TREND_GRANULARITIES[granularity])}
+        if granularity == "minute":
+            fields["expire_at"] = bucket + _MINUTE_BUCKET_TTL
+        return fields
+
+    async def _increment_trend_counts(self, items: List[SentimentRecord]):
+        """ Adds newly saved records to the per-sentiment counters of their trend_cache buckets.
 
+        Records are bucketed by their own (often publication) timestamp, so old posts
+        update old buckets. Minute buckets are only written for the last hour, which is all '1h'
+        reads, and get an expire_at so the TTL index drops them soon after.
+        """
+        minute_cutoff = (datetime.now(timezone.utc) - timedelta(hours=1)).replace(second=0, microsecond=0)
+        counts: Dict[tuple, Counter] = {}
+        for item in items:
+            if item.analysis.sentiment not in _SENTIMENTS:
+                continue
+            buckets = {
+                "minute": item.timestamp.replace(second=0, microsecond=0),
+                "hour": item.timestamp.replace(minute=0, second=0, microsecond=0),
+            }
+            for granularity, bucket in buckets.items():
+                if granularity == "minute" and bucket < minute_cutoff:
+                    continue
+                counts.setdefault((item.query, granularity, bucket), Counter())[item.analysis.sentiment] += 1
+        if not counts:
+            return
+        await self.trend_cache.bulk_write(
+            [
+                UpdateOne(
+                    {"query": query, "granularity": granularity, "bucket": bucket},
+                    {
+                        "$inc": {sentiment: sentiment_counts[sentiment] for sentiment in _SENTIMENTS},
+                        "$setOnInsert": self._trend_bucket_fields(granularity, bucket),
+                    },
+                    upsert=True
+                )
+                for (query, granularity, bucket), sentiment_counts in counts.items()
+            ],
+            ordered=False
+        )
+
+    async def _increment_aspect_counts(self, items: List[SentimentRecord]):
+        """ Adds the aspects of newly saved records to the hourly aspect_counts buckets. """
+        counts = Counter()
+        for item in items:
+            bucket = item.timestamp.replace(minute=0, second=0, microsecond=0)
+            for aspect in item.analysis.aspects:
+                counts[(item.query, bucket, aspect.aspect)] += 1
+        if not counts:
+            return
+        await self.aspect_counts.bulk_write(
+            [
+                UpdateOne({"query": query, "bucket": bucket, "aspect": aspect}, {"$inc": {"count": count}}, upsert=True)
+                for (query, bucket, aspect), count in counts.items()
+            ],
+            ordered=False
+        )
+
+    @cached_query_read
     async def get_sentiment_distribution(self, query: str, time_range: str) -> SentimentData:
         """ Retrieves sentiment distribution for a given query over the last 24 hours. 
         
@@ -104,13 +408,14 @@ class MongoManager:
             {"$match": {"query": query, **time_filter}},
             {"$group":{"_id":"$analysis.sentiment","count":{"$sum":1}}},
         ]
-        results = await self.collection.aggregate(pipeline).to_list(None)
+        results = await self._aggregate(pipeline)
         dist = {"positive": 0, "negative": 0, "neutral": 0}
         for res in results:
             if res["_id"] in dist:
                 dist[res["_id"]] = res["count"]
         return SentimentData(**dist)
     
+    @cached_query_read
     async def get_sentiment_trends(self, query: str, time_range: str) -> List[TrendData]:
         """ Retrieves sentiment trends for a given query over a specified time range. 
         
@@ -120,17 +425,41 @@ class MongoManager:
         Returns:
             List[TrendData]: List of sentiment trend data.
         """
-        time_filter = self.get_time_range_filter(time_range)
+        # Served from the materialized trend_cache (kept current by save_feed_item)
+        start_time = self.get_time_range_filter(time_range)["timestamp"]["$gte"]
         if time_range == '1h':
-            date_format = "%Y-%m-%dT%H:%M:00Z"
+            granularity = "minute"
+            start_bucket = start_time.replace(second=0, microsecond=0)
         else:
-            date_format = "%Y-%m-%dT%H:00:00Z"
+            granularity = "hour"
+            start_bucket = start_time.replace(minute=0, second=0, microsecond=0)
+
+        cursor = self.trend_cache.find(
+            {"query": query, "granularity": granularity, "bucket": {"$gte": start_bucket}},
+            {"_id": 0, "timestamp": "$time_bucket", "positive": 1, "negative": 1, "neutral": 1},
+        ).sort("bucket", 1)
+        results = await cursor.to_list(None)
+        return [TrendData(**res) for res in results]
+    
+    async def get_competitor_trends(self, products: List[str], time_range:str) -> List[ProductTrend]:
+        """ Retrieves sentiment trends for multiple products over a specified time range. 
+        
+        Args:
+            products (List[str]): List of product names.
+            time_range (str): Time range filter ('1h', '24h', '7d').
+        Returns:
+            List[ProductTrend]: List of product trend data.
+        """
+        time_filter = self.get_time_range_filter(time_range)
+        date_format = "%Y-%m-%dT%H:%M:00Z" if time_range == '1h' else "%Y-%m-%dT%H:00:00Z"
 
+        # One index range scan over all products instead of one aggregation per product
         pipeline = [
-            {"$match": {"query": query, **time_filter}},
+            {"$match": {"query": {"$in": products}, **time_filter}},
             {
                 "$group": {
                     "_id": {
+                        "product": "$query",
                         "time_bucket": {
                             "$dateToString": {"format": date_format, "date": "$timestamp"}
                         },
@@ -141,42 +470,37 @@ class MongoManager:
             },
             {
                 "$group": {
-                    "_id": "$_id.time_bucket",
+                    "_id": {"product": "$_id.product", "time_bucket": "$_id.time_bucket"},
                     "counts": {"$push": {"k": "$_id.sentiment", "v": "$count"}},
                 }
             },
             {"$addFields": {"sentiments": {"$arrayToObject": "$counts"}}},
-            {"$sort": {"_id": 1}},
+            {"$sort": {"_id.product": 1, "_id.time_bucket": 1}},
             {
-                "$project": {
-                    "_id": 0,
-                    "timestamp": "$_id",
-                    "positive": {"$ifNull": ["$sentiments.positive", 0]},
-                    "negative": {"$ifNull": ["$sentiments.negative", 0]},
-                    "neutral": {"$ifNull": ["$sentiments.neutral", 0]},
+                "$group": {
+                    "_id": "$_id.product",
+                    "trends": {
+                        "$push": {
+                            "timestamp": "$_id.time_bucket",
+                            "positive": {"$ifNull": ["$sentiments.positive", 0]},
+                            "negative": {"$ifNull": ["$sentiments.negative", 0]},
+                            "neutral": {"$ifNull": ["$sentiments.neutral", 0]},
+                        }
+                    },
                 }
             },
         ]
-        results = await self.collection.aggregate(pipeline).to_list(None)
-        return [TrendData(**res) for res in results]
-    
-    async def get_competitor_trends(self, products: List[str], time_range:str) -> List[ProductTrend]:
-        """ Retrieves sentiment trends for multiple products over a specified time range. 
-        
-        Args:
-            products (List[str]): List of product names.
-            time_range (str): Time range filter ('1h', '24h', '7d').
-        Returns:
-            List[ProductTrend]: List of product trend data.
-        """
-        tasks = [self.get_sentiment_trends(product, time_range) for product in products]
-        results = await asyncio.gather(*tasks)
+        results = await self._aggregate(pipeline)
+        trends_by_product = {res["_id"]: res["trends"] for res in results}
 
-        comparsion_data = []
-        for product, trends in zip(products, results):
-            comparsion_data.append(ProductTrend(product_name=product, trends=trends))
-
-        return comparsion_data
+        # Keep request order and include products without data
+        return [
+            ProductTrend(
+                product_name=product,
+                trends=[TrendData(**trend) for trend in trends_by_product.get(product, [])]
+            )
+            for product in products
+        ]
 
     async def get_recent_feed(self, query: str, limit: int = 50) -> List[FeedItem]:
         """ Retrieves the most recent feed items for a given query. 
@@ -187,24 +511,26 @@ class MongoManager:
         Returns:
             List[FeedItem]: List of recent feed items.
         """
-        cursor = self.collection.find({"query": query}).sort("timestamp", -1).limit(limit)
-        items = await cursor.to_list(length=limit)
-        processed_items = []
-        for item in items:
-            analysis = item.get("analysis", {})
-            processed_items.append(
-                {
-                    "_id": str(item['_id']),
-                    "text": item.get("text"),
-                    "sentiment": analysis.get("sentiment"),
-                    "score": analysis.get("score"),
-                    "timestamp": item.get("timestamp"),
-                    "source": item.get("source"),
-                    "query": item.get("query"),
-                }
+        # Skip analysis.aspects and other unused fields on the wire
+        projection = {
+            "text": 1, "analysis.sentiment": 1, "analysis.score": 1,
+            "timestamp": 1, "source": 1, "query": 1
+        }
+        cursor = self.collection.find({"query": query}, projection).sort("timestamp", -1).limit(limit)
+        return [
+            FeedItem(
+                _id=str(item["_id"]),
+                text=item.get("text"),
+                sentiment=item.get("analysis", {}).get("sentiment"),
+                score=item.get("analysis", {}).get("score"),
+                timestamp=item.get("timestamp"),
+                source=item.get("source"),
+                query=item.get("query"),
             )
-        return [FeedItem(**item) for item in processed_items]
+            async for item in cursor
+        ]
     
+    @cached_query_read
     async def get_word_cloud_data(self, query: str, time_range: str = '24h') -> List[WordCloudData]:
         """ Retrieves word cloud data for a given query over the last 24 hours. 
         
@@ -215,17 +541,19 @@ class MongoManager:
         Returns:
             List[WordCloudData]: List of word cloud data.
         """
-        time_filter = self.get_time_range_filter(time_range)
+        # Reads the hourly pre-aggregated counts instead of unwinding every feed item;
+        # the window start is rounded down to the bucket boundary
+        start_time = self.get_time_range_filter(time_range)["timestamp"]["$gte"]
+        start_bucket = start_time.replace(minute=0, second=0, microsecond=0)
         pipeline = [
-            {"$match": {"query": query, **time_filter}},
-            {"$unwind": "$analysis.aspects"},
-            {"$group": {"_id": "$analysis.aspects.aspect", "count": {"$sum": 1}}},
+            {"$match": {"query": query, "bucket": {"$gte": start_bucket}}},
+            {"$group": {"_id": "$aspect", "count": {"$sum": "$count"}}},
             {"$sort": {"count": -1}},
             {"$limit": 50},
             {"$project": {"text": "$_id", "value": "$count", "_id": 0}},
         ]
 
-        results = await self.collection.aggregate(pipeline).to_list(None)
+        results = await self._aggregate(pipeline, self.aspect_counts)
         return [WordCloudData(**res) for res in results]
     
     async def get_documents_for_summary(self, query: str, sample_size: int = 25, time_range: str = '24h') -> Dict[str, List[str]]:
@@ -238,32 +566,35 @@ class MongoManager:
             Dict[str, List[str]]: Dictionary with list of document texts.
         """
         time_filter = self.get_time_range_filter(time_range)
-        positive_docs_cursor = self.collection.find(
-            {"query": query, "analysis.sentiment": "positive", **time_filter},
-            {"text": 1, "_id": 0}
-        ).limit(sample_size)
-
-        negative_docs_cursor = self.collection.find(
-            {"query": query, "analysis.sentiment": "negative", **time_filter},
-            {"text": 1, "_id": 0}
-        ).limit(sample_size)
-
-        positive_docs = [
-            doc['text'] for doc in await positive_docs_cursor.to_list(length=sample_size)
-        ]
 
-        negative_docs = [
-            doc['text'] for doc in await negative_docs_cursor.to_list(length=sample_size)
+        def sample_stages(sentiment: str) -> List[Dict]:
+            # Each branch is bounded by the (query, analysis.sentiment, timestamp) index and stops at sample_size
+            return [
+                {"$match": {"query": query, "analysis.sentiment": sentiment, **time_filter}},
+                {"$sort": {"timestamp": -1}},
+                {"$limit": sample_size},
+                {"$project": {"_id": 0, "text": 1, "sentiment": "$analysis.sentiment"}},
+            ]
+
+        # Both samples in one round-trip
+        pipeline = sample_stages("positive") + [
+            {"$unionWith": {"coll": self.collection.name, "pipeline": sample_stages("negative")}}
         ]
+        # Pin the compound index so the planner can't pick the (query, timestamp) one and filter sentiment in memory
+        # aggregate() sends hint as-is, and the server only accepts a key document or index name
+        results = await self._aggregate(pipeline, hint=dict(_QUERY_SENTIMENT_INDEX))
 
-        return {
-            "positive": positive_docs,
-            "negative": negative_docs
-        }
+        docs = {"positive": [], "negative": []}
+        for doc in results:
+            docs[doc["sentiment"]].append(doc["text"])
+        return docs
     
 
     async def delete_old_records(self, days: int = 30):
         """ Deletes records older than the specified number of days. 
+
+        Routine retention is handled by the TTL index (RECORD_RETENTION_DAYS);
+        use this for on-demand cleanups with a shorter window.
         
         Args:
             days (int): Number of days to retain records.
@@ -274,5 +605,27 @@ class MongoManager:
         try:
             result = await self.collection.delete_many({"timestamp": {"$lt": cutoff_date}})
             logging.info(f"Deleted {result.deleted_count} old records from the database.")
+            await self.aspect_counts.delete_many({"bucket": {"$lt": cutoff_date}})
+            await self.trend_cache.delete_many({"bucket": {"$lt": cutoff_date}})
         except Exception as e:
-            logging.error(f"Error deleting old records: {e}")
\ No newline at end of file
+            logging.error(f"Error deleting old records: {e}")
+        # Cached aggregations may include deleted records (also after a partial failure)
+        self._read_cache.clear()
+
+
+# Process-wide manager, created once under the lock so concurrent first calls share one pool
+_manager: Optional[MongoManager] = None
+_manager_lock = asyncio.Lock()
+
+
+async def get_manager() -> MongoManager:
+    """ Returns the shared MongoManager, creating it and its indexes on first use. """
+    global _manager
+    if _manager is None:
+        async with _manager_lock:
+            if _manager is None:
+                logging.info("Initializing MongoManager...")
+                manager = MongoManager()
+                await manager.ensure_indexes()
+                _manager = manager
+    return _manager
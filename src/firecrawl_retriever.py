@@ -1,19 +1,24 @@
-from firecrawl import FirecrawlApp
 from typing import List, Dict, Any
 from datetime import datetime, timezone
 import os
 import logging
+from .http_client import get_http_client
 
 class FirecrawlScraper:
     """Scrapes web content using the Firecrawl API."""
+    SCRAPE_URL = "https://api.firecrawl.dev/v1/scrape"
+
     def __init__(self, api_key: str):
         if not api_key:
             raise ValueError("Firecrawl API key is not provided.")
-        self.app = FirecrawlApp(api_key=api_key)
+        self.headers = {"Authorization": f"Bearer {api_key}"}
         logging.info("FirecrawlScraper initialized with provided API key.")
     
-    def scrape(self, url: str) -> List[Dict[str, Any]]:
+    async def scrape_async(self, url: str) -> List[Dict[str, Any]]:
         """Scrapes a single URL and returns the main content in the standard format.
+
+        Uses the REST endpoint over the shared HTTP client, so concurrent scrapes
+        share pooled connections instead of each blocking a worker thread.
         
         Args:
             url (str): The URL to scrape.
@@ -23,10 +28,17 @@ class FirecrawlScraper:
         """
         logging.info(f"Scraping URL via Firecrawl: {url}")
         try:
-            scrapped_data = self.app.scrape(url)
-            if 'markdown' in scrapped_data and scrapped_data['markdown'].strip():
+            response = await get_http_client().post(
+                self.SCRAPE_URL,
+                json={"url": url, "formats": ["markdown"]},
+                headers=self.headers
+            )
+            response.raise_for_status()
+            scrapped_data = response.json().get('data') or {}
+            markdown = scrapped_data.get('markdown') or ''
+            if markdown.strip():
                 return [{
-                    "text": scrapped_data['markdown'],
+                    "text": markdown,
                     "source": "WebApp",
                     "timestamp": datetime.now(timezone.utc),
                     "url": url
@@ -39,11 +51,11 @@ class FirecrawlScraper:
 
 # Example usage (for testing)
 if __name__ == '__main__':
+    import asyncio
     from dotenv import load_dotenv
     load_dotenv()
     
     scraper = FirecrawlScraper(api_key=os.getenv('FIRECRAWL_API_KEY'))
-    results = scraper.scrape(url='https://blog.google/technology/ai/google-gemini-ai/')
+    results = asyncio.run(scraper.scrape_async(url='https://blog.google/technology/ai/google-gemini-ai/'))
     if results:
         print(results[0]['text'][:500])
-        
\ No newline at end of file
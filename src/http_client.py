@@ -0,0 +1,31 @@
+from typing import Optional
+import httpx
+import logging
+
+# httpx logs full request URLs at INFO, which would include API keys passed as query params
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Shared across all scrapers so requests reuse pooled (HTTP/2) connections
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Returns the process-wide async HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_connections=100)
+        )
+        logging.info("Shared HTTP client created.")
+    return _client
+
+
+async def close_http_client():
+    """Closes the shared HTTP client (call on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logging.info("Shared HTTP client closed.")
@@ -80,6 +80,15 @@ class AspectSentiment(BaseModel):
     def  to_lowercase(cls, v: str) -> str:
         return v.lower()
 
+class AspectList(BaseModel):
+    """Wrapper for the LLM aspect extraction response of a single text."""
+    aspects: List[AspectSentiment] = Field(default_factory=list)
+
+class AspectBatchEntry(BaseModel):
+    """Aspects extracted for one text of a batched LLM request."""
+    id: int
+    aspects: List[AspectSentiment] = Field(default_factory=list)
+
 class AnalysisResult(BaseModel):
     """Detailed analysis result from the LLM for a single text document."""
     sentiment: Literal['positive', 'negative', 'neutral']
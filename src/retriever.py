@@ -1,13 +1,13 @@
 from typing import List, Dict, Any
-import tweepy
 import asyncpraw
-from googleapiclient.discovery import build
-import serpapi
+import httpx
 from datetime import datetime, timezone
 import asyncio
+import itertools
 import os
 import logging
 from .firecrawl_retriever import FirecrawlScraper
+from .http_client import get_http_client
 
 # --- Initialization ---
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -16,21 +16,34 @@ logger = logging.getLogger(__name__)
 # --- Individual Scraper Classes ---
 
 class TwitterScraper:
+    SEARCH_URL = "https://api.twitter.com/2/tweets/search/recent"
+
     def __init__(self, api_key: str):
-        self.client = tweepy.Client(bearer_token=api_key) if api_key else None
+        self.api_key = api_key
     
-    def search(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
-        if not self.client:
+    async def search(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
+        if not self.api_key:
             logger.warning("Twitter client not initialized. Skipping search.")
             return []
         logger.info(f"Searching Twitter for '{query}'")
         try:
-            response = self.client.search_recent_tweets(
-                query=f"{query} -is:retweet lang:en",
-                max_results=max(10, min(max_results, 100)),
-                tweet_fields=['created_at', 'text']
+            response = await get_http_client().get(
+                self.SEARCH_URL,
+                params={
+                    "query": f"{query} -is:retweet lang:en",
+                    "max_results": max(10, min(max_results, 100)),
+                    "tweet.fields": "created_at,text"
+                },
+                headers={"Authorization": f"Bearer {self.api_key}"}
             )
-            return [{"text": t.text, "source": "Twitter", "timestamp": t.created_at} for t in response.data or []]
+            response.raise_for_status()
+            return [
+                {
+                    "text": t["text"], "source": "Twitter",
+                    "timestamp": datetime.fromisoformat(t["created_at"].replace("Z", "+00:00"))
+                }
+                for t in response.json().get("data", [])
+            ]
         except Exception as e:
             logger.error(f"Error searching tweets: {e}")
             return []
@@ -56,56 +69,87 @@ class RedditScraper:
         except Exception as e:
             logger.error(f"Error searching Reddit: {e}")
             return []
-        finally:
-            if self.client: await self.client.close()
+
+    async def aclose(self):
+        """Closes the Reddit session (call once on shutdown; the client is reused across searches)."""
+        if self.client:
+            await self.client.close()
 
 class GoogleNewsScraper:
+    SEARCH_URL = "https://serpapi.com/search.json"
+
     def __init__(self, api_key: str):
         self.api_key = api_key
 
-    def search(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
+    async def search(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
         if not self.api_key:
             logger.warning("SerpApi client not initialized. Skipping Google News search.")
             return []
         logger.info(f"Searching Google News for '{query}'")
         try:
             params = {"engine": "google_news", "q": query, "api_key": self.api_key, "num": max_results}
-            search = serpapi.search(params)
-            items = search.get("news_results", [])
+            response = await get_http_client().get(self.SEARCH_URL, params=params)
+            response.raise_for_status()
+            items = response.json().get("news_results", [])
             return [
                 {"text": item.get("snippet", ""), "source": "Google News", "timestamp": datetime.now(timezone.utc), "url": item.get("link")}
                 for item in items if item.get("snippet") and item.get("link")
             ]
+        except httpx.HTTPStatusError as e:
+            # SerpApi only takes the key as a query parameter; keep it out of the logs
+            logger.error(f"Error searching Google News: HTTP {e.response.status_code} for {e.request.url.copy_remove_param('api_key')}")
+            return []
         except Exception as e:
             logger.error(f"Error searching Google News: {e}")
             return []
 
 class YouTubeScraper:
+    API_URL = "https://www.googleapis.com/youtube/v3"
+
     def __init__(self, api_key: str):
-        self.client = build("youtube", "v3", developerKey=api_key) if api_key else None
+        self.api_key = api_key
+        # Sent as a header so the key never appears in request URLs (and error messages)
+        self.headers = {"X-Goog-Api-Key": api_key} if api_key else {}
+
+    async def _video_comments(self, video_id: str, max_results: int) -> List[Dict[str, Any]]:
+        try:
+            response = await get_http_client().get(
+                f"{self.API_URL}/commentThreads",
+                params={"part": "snippet", "videoId": video_id, "maxResults": max_results, "textFormat": "plainText"},
+                headers=self.headers
+            )
+            response.raise_for_status()
+            comments = []
+            for item in response.json().get('items', []):
+                comment = item['snippet']['topLevelComment']['snippet']
+                comments.append({
+                    "text": comment['textDisplay'], "source": "YouTube",
+                    "timestamp": datetime.strptime(comment['publishedAt'], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+                })
+            return comments
+        except Exception:
+            # Comments are often disabled on individual videos
+            return []
     
-    def search(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
-        if not self.client:
+    async def search(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
+        if not self.api_key:
             logger.warning("YouTube client not initialized. Skipping search.")
             return []
         logger.info(f"Searching YouTube for '{query}'")
         try:
-            s_res = self.client.search().list(q=query, part='id', maxResults=max(1, max_results//5), type='video').execute()
-            video_ids = [item['id']['videoId'] for item in s_res.get('items', [])]
+            response = await get_http_client().get(
+                f"{self.API_URL}/search",
+                params={"q": query, "part": "id", "maxResults": max(1, max_results//5), "type": "video"},
+                headers=self.headers
+            )
+            response.raise_for_status()
+            video_ids = [item['id']['videoId'] for item in response.json().get('items', [])]
             if not video_ids: return []
             
-            comments = []
+            # Fetch comment threads for all videos concurrently
             comments_per_video = max(1, max_results // len(video_ids))
-            for video_id in video_ids:
-                try:
-                    c_res = self.client.commentThreads().list(part='snippet', videoId=video_id, maxResults=comments_per_video, textFormat='plainText').execute()
-                    for item in c_res.get('items', []):
-                        comment = item['snippet']['topLevelComment']['snippet']
-                        comments.append({
-                            "text": comment['textDisplay'], "source": "YouTube",
-                            "timestamp": datetime.strptime(comment['publishedAt'], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
-                        })
-                except Exception: continue
+            per_video = await asyncio.gather(*(self._video_comments(video_id, comments_per_video) for video_id in video_ids))
+            comments = [comment for video_comments in per_video for comment in video_comments]
             return comments[:max_results]
         except Exception as e:
             logger.error(f"Error searching YouTube: {e}")
@@ -168,37 +212,42 @@ class MultiAPIRetriever:
         return self._firecrawl
     
     async def retrieve(self, query: str, max_results_per_api: int = 20) -> List[Dict[str, Any]]:
-        # CORRECTED: Uncommented the scrapers to ensure they run.
-        scrapers = [
-            self.reddit.search(query, max_results_per_api),
-            asyncio.to_thread(self.twitter.search, query, max_results_per_api),
-            asyncio.to_thread(self.youtube.search, query, max_results_per_api),
+        # Start every independent source at once; Google News only gates the Firecrawl scrapes
+        scraper_tasks = [
+            asyncio.create_task(self.reddit.search(query, max_results_per_api)),
+            asyncio.create_task(self.twitter.search(query, max_results_per_api)),
+            asyncio.create_task(self.youtube.search(query, max_results_per_api)),
         ]
-
-        google_results = await asyncio.to_thread(self.google_news.search, query, 5)
-        
-        firecrawl_tasks = []
-        for result in google_results:
-            if result.get('url'):
-                firecrawl_tasks.append(asyncio.to_thread(self.firecrawl.scrape, result['url']))
+        google_task = asyncio.create_task(self.google_news.search(query, 5))
 
         try:
-            all_tasks = scrapers + firecrawl_tasks
-            all_results = await asyncio.gather(*all_tasks, return_exceptions=True)
+            google_results = await google_task
+
+            firecrawl_tasks = []
+            for result in google_results:
+                if result.get('url'):
+                    firecrawl_tasks.append(self.firecrawl.scrape_async(result['url']))
+
+            all_results = await asyncio.gather(*scraper_tasks, *firecrawl_tasks, return_exceptions=True)
 
-            final_data = google_results
             for res in all_results:
-                if isinstance(res, list):
-                    final_data.extend(res)
-                elif isinstance(res, Exception):
+                if isinstance(res, Exception):
                     logger.error(f"Error during data retrieval: {res}")
+            # Build a new list in one pass instead of extending google_results in place
+            final_data = list(itertools.chain(google_results, *(res for res in all_results if isinstance(res, list))))
             
             logger.info(f"Retrieved total {len(final_data)} items from all APIs for query '{query}'.")
             return final_data
         finally:
-            # Ensure reddit client is closed to avoid unclosed session warnings
+            # Don't leave scrapers running if Google News or Firecrawl setup failed
+            for task in scraper_tasks:
+                task.cancel()
+
+    async def aclose(self):
+        """Closes long-lived scraper sessions. Call on application shutdown."""
+        if self._reddit is not None:
             try:
-                await self.reddit.close()
-            except Exception:
-                pass
+                await self._reddit.aclose()
+            except Exception as e:
+                logger.error(f"Error closing Reddit client: {e}")
 
@@ -1,12 +1,27 @@
 import asyncio
 from typing import List, Dict, Any, Optional
 from .retriever import MultiAPIRetriever
-from .analysis import TransformersAnalysis, GroqAnalysis
-from .database import MongoManager
+from .analysis import get_transformers_analysis, GroqAnalysis
+from .database import get_manager
 from .models import SentimentRecord
 from datetime import datetime, timezone
 from collections import defaultdict
+import hashlib
 import logging
+import re
+
+# Product-specific keywords that suggest a text has extractable aspects.
+# Single case-insensitive pass; matches substrings like the original `in` checks.
+_ASPECT_KEYWORDS_RE = re.compile(
+    "|".join([
+        "battery", "screen", "performance", "design", "price", "quality",
+        "durability", "camera", "software", "features", "support"
+    ]),
+    re.IGNORECASE
+)
+
+# Scraped pages (e.g. Firecrawl markdown) can be tens of KB; only the start is analyzed and stored
+MAX_TEXT_CHARS = 4000
 
 class AnalysisPipeline:
     """
@@ -17,12 +32,13 @@ class AnalysisPipeline:
 
     def __init__(self, max_concurrent_llm: int = 5):
         self.retriever = MultiAPIRetriever()
-        self.transformers_analyzer = TransformersAnalysis()
-        self.groq_analyzer = GroqAnalysis()
-        self.db_manager = MongoManager()
+        self.transformers_analyzer = get_transformers_analysis()
+        # Reduced conncurrency for LLM to avoid rate limits (enforced per request in GroqAnalysis)
+        self.groq_analyzer = GroqAnalysis(max_concurrent_llm=max_concurrent_llm)
 
-        # Reduced conncurrency for LLM to avoid rate limits
-        self.analysis_semaphore = asyncio.Semaphore(max_concurrent_llm)
+        # Bounded hand-off between analysis and database writes
+        self.stream_queue_size = 1000
+        self.save_batch_size = 500
 
         # Track LLM usage
         self.llm_call_count = 0
@@ -47,19 +63,15 @@ class AnalysisPipeline:
             return True
         
         # Use LLM if text contains product-specific keywords (example logic)
-        aspect_keywords = [
-            "battery", "screen", "performance", "design", "price", "quality",
-            "durability", "camera", "software", "features", "support"
-        ]
-        if any(keyword in text.lower() for keyword in aspect_keywords):
+        if _ASPECT_KEYWORDS_RE.search(text):
             return True
         
         return False
     
-    async def _analyze_with_hybrid_strategy(self, item: dict, query: str, index: int, total: int) -> Optional[SentimentRecord]:
+    async def _analyze_with_hybrid_strategy(self, item: dict, query: str, index: int, total: int, sentiment_data: Optional[Dict] = None) -> Optional[SentimentRecord]:
         """
         Strategy:
-        1. Quick sentiment check with Transformers (always)
+        1. Quick sentiment check with Transformers (always, batched by the caller when possible)
         2. Aspect extraction with LLM (selectively)
         3. Fallback to Transformers-only if LLM fails
         """
@@ -73,57 +85,73 @@ class AnalysisPipeline:
 
         if use_llm:
             # Try hybrid approach
-            async with self.analysis_semaphore:
-                try:
-                    analysis_result = await self.groq_analyzer.analyze_text(
+            try:
+                analysis_result = await self.groq_analyzer.analyze_text(
+                    text=text,
+                    use_hybrid=True,
+                    sentiment_data=sentiment_data
+                )
+                self.llm_call_count += 1
+
+                if analysis_result:
+                    return SentimentRecord(
+                        query=query,
                         text=text,
-                        use_hybrid=True
+                        source=item.get('source', 'unknown'),
+                        timestamp=item['timestamp'],
+                        analysis=analysis_result
                     )
-                    self.llm_call_count += 1
-
-                    if analysis_result:
-                        return SentimentRecord(
-                            query=query,
-                            text=text,
-                            source=item.get('source', 'unknown'),
-                            timestamp=item.get('timestamp', datetime.now(timezone.utc)),
-                            analysis=analysis_result
-                        )
-                except Exception as e:
-                    logging.error(f"Hybrid analysis failed: {e}, falling back to Transformers.")
+            except Exception as e:
+                logging.error(f"Hybrid analysis failed: {e}, falling back to Transformers.")
         # Fallback to Transformers-only analysis
         try:
-            analysis_result = self.transformers_analyzer.basic_analysis(text)
+            analysis_result = self.transformers_analyzer.basic_analysis(text, sentiment_data)
             self.transformer_call_count += 1
 
             return SentimentRecord(
                 query=query,
                 text=text,
                 source=item.get('source', 'unknown'),
-                timestamp=item.get('timestamp', datetime.now(timezone.utc)),
+                timestamp=item['timestamp'],
                 analysis=analysis_result
             )
         except Exception as e:
             logging.error(f"Transformers analysis failed: {e}")
             return None
     
+    def _batch_sentiments(self, items: List[dict]) -> List[Optional[Dict]]:
+        """
+        Run Transformers sentiment for all items in one batched call.
+        Returns one entry per item (None for items without text).
+        """
+        indexed_texts = [(idx, item.get('text', '')) for idx, item in enumerate(items) if item.get('text')]
+        batch = self.transformers_analyzer.analyze_sentiments_batch([text for _, text in indexed_texts])
+
+        sentiments: List[Optional[Dict]] = [None] * len(items)
+        for (idx, _), sentiment_data in zip(indexed_texts, batch):
+            sentiments[idx] = sentiment_data
+        return sentiments
+
     async def _batch_analyze_transformers(self, items: List[dict], query: str) -> List[SentimentRecord]:
         """
         Batch analyze a list of items using only Transformers for speed.
         Use this for simple sentiment analysis without aspects.
         """
+        items = [item for item in items if item.get('text')]
+        try:
+            analyses = self.transformers_analyzer.basic_analysis_batch([item['text'] for item in items])
+        except Exception as e:
+            logging.error(f"Transformers batch analysis failed: {e}")
+            return []
+
         records = []
-        for item in items:
-            text = item.get('text', '')
-            if not text:
-                continue
+        for item, analysis in zip(items, analyses):
             try:
-                analysis = self.transformers_analyzer.basic_analysis(text)
                 record = SentimentRecord(
                     query=query,
-                    text=text,
+                    text=item['text'],
                     source=item.get('source', 'unknown'),
-                    timestamp=item.get('timestamp', datetime.now(timezone.utc)),
+                    timestamp=item['timestamp'],
                     analysis=analysis
                 )
                 records.append(record)
@@ -132,6 +160,60 @@ class AnalysisPipeline:
                 logging.error(f"Transformers batch analysis failed: {e}")
         return records
     
+    async def _analyze_and_save_streaming(self, items: List[dict], query: str, sentiments: List[Optional[Dict]]) -> int:
+        """
+        Analyze items with the hybrid strategy and save records as they complete.
+        Records flow through a bounded queue to a consumer that writes them in
+        chunks, so memory stays bounded instead of holding every record until the end.
+        Returns the number of records handed to the database.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.stream_queue_size)
+        consumer = asyncio.create_task(self._save_records_from_queue(queue))
+        total = len(items)
+
+        async def produce(idx: int, item: dict):
+            record = await self._analyze_with_hybrid_strategy(item, query, idx, total, sentiments[idx])
+            if record is not None:
+                await queue.put(record)
+
+        producers = asyncio.gather(*(produce(idx, item) for idx, item in enumerate(items)), return_exceptions=True)
+        # The consumer only finishes before the sentinel if it failed; stop producers
+        # that would otherwise block forever on a full queue
+        consumer.add_done_callback(lambda _: producers.cancel())
+        try:
+            await producers
+        except asyncio.CancelledError:
+            if not consumer.done():
+                raise
+        finally:
+            if not consumer.done():
+                # Sentinel: flush whatever is buffered, also when the run is cancelled
+                sentinel = asyncio.ensure_future(queue.put(None))
+                await asyncio.wait({sentinel, consumer}, return_when=asyncio.FIRST_COMPLETED)
+                sentinel.cancel()
+            # Re-raises the consumer's error if saving failed
+            saved = await consumer
+        return saved
+
+    async def _save_records_from_queue(self, queue: asyncio.Queue) -> int:
+        """Drains records from the queue and saves them in chunks of `save_batch_size`."""
+        db_manager = await get_manager()
+        saved = 0
+        batch: List[SentimentRecord] = []
+        while True:
+            record = await queue.get()
+            if record is None:
+                break
+            batch.append(record)
+            if len(batch) >= self.save_batch_size:
+                await db_manager.save_feed_item(batch)
+                saved += len(batch)
+                batch = []
+        if batch:
+            await db_manager.save_feed_item(batch)
+            saved += len(batch)
+        return saved
+
     async def run(self, query: str, mode: str = 'hybrid') -> Dict[str, Any]:
         """
         xecute the pipeline with configurable modes:
@@ -155,36 +237,51 @@ class AnalysisPipeline:
             return self._build_stats(0,0,mode)
         logging.info(f"Retrieved {len(retrieved_items)} items.")
 
-        # 2. Analyze data
+        # Drop duplicate texts (sources often overlap), truncate once so LLM prompts,
+        # transformer inputs and stored records stay small, and stamp items without
+        # a timestamp with one shared run time
+        now = datetime.now(timezone.utc)
+        seen = set()
+        unique_items = []
+        for item in retrieved_items:
+            text = item.get('text')
+            if not text:
+                continue
+            fingerprint = hashlib.blake2b(text.strip().lower().encode('utf-8'), digest_size=16).digest()
+            if fingerprint in seen:
+                continue
+            seen.add(fingerprint)
+
+            if len(text) > MAX_TEXT_CHARS:
+                item['text'] = text[:MAX_TEXT_CHARS]
+            if 'timestamp' not in item:
+                item['timestamp'] = now
+            unique_items.append(item)
+
+        if len(unique_items) < len(retrieved_items):
+            logging.info(f"Skipping {len(retrieved_items) - len(unique_items)} duplicate or empty items.")
+        retrieved_items = unique_items
+
+        # 2. Analyze data and 3. Save to database
         if mode == 'transformers':
             successful_records = await self._batch_analyze_transformers(retrieved_items, query)
+            if successful_records:
+                db_manager = await get_manager()
+                await db_manager.save_feed_item(successful_records)
+            saved = len(successful_records)
         
         elif mode == 'llm':
-            tasks = [
-                self._analyze_with_hybrid_strategy(item, query, idx, len(retrieved_items))
-                for idx, item in enumerate(retrieved_items)
-            ]
-            analysis_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            successful_records = [
-                res for res in analysis_results if isinstance(res, SentimentRecord)
-            ]
+            sentiments = self._batch_sentiments(retrieved_items)
+            saved = await self._analyze_and_save_streaming(retrieved_items, query, sentiments)
         else: # hybrid (default)
-            tasks = [
-                self._analyze_with_hybrid_strategy(item, query, idx, len(retrieved_items))
-                for idx, item in enumerate(retrieved_items)
-            ]
-            analysis_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            successful_records = [
-                res for res in analysis_results if isinstance(res, SentimentRecord)
-            ]
-        # 3. Save to database
-        if successful_records:
-            await self.db_manager.save_feed_item(successful_records)
-            logging.info(f"Pipeline completed: {len(successful_records)}/{len(retrieved_items)} records saved.")
+            sentiments = self._batch_sentiments(retrieved_items)
+            saved = await self._analyze_and_save_streaming(retrieved_items, query, sentiments)
+
+        if saved:
+            logging.info(f"Pipeline completed: {saved}/{len(retrieved_items)} records saved.")
         else:
             logging.warning("No items could be analyzed successfully.")
+        return self._build_stats(saved, len(retrieved_items), mode)
 
     def _build_stats(self, saved: int, total: int, mode: str) -> Dict[str, Any]:
         """Build statistics report."""
@@ -209,7 +306,8 @@ class AnalysisPipeline:
         stats = await self.run(query=query, mode=mode)
         
         # Fetch recent results for summary
-        records = await self.db_manager.get_recent_feed(query=query, limit=50)
+        db_manager = await get_manager()
+        records = await db_manager.get_recent_feed(query=query, limit=50)
 
         if records:
             sentiment_groups = defaultdict(list)